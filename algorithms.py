@@ -1,6 +1,98 @@
 import numpy as np
 
-def classical_dp_qkp(weights, profits, capacity):
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; algorithm 3 falls back to NumPy
+    njit = None
+
+def _scratch_array(scratch, name, shape, dtype, fill):
+    """
+    Return an array of the given shape filled with `fill`, reusing a scratch buffer if possible.
+
+    Parameters:
+    - scratch: Dictionary of reusable buffers, or None to always allocate.
+    - name: Key of the buffer in `scratch`.
+    - shape: Shape of the array.
+    - dtype: Data type of the array.
+    - fill: Value every cell is reset to.
+
+    Returns:
+    - The filled array. It is stored in `scratch` for the next call when `scratch` is given.
+    """
+    if scratch is None:
+        return np.full(shape, fill, dtype=dtype)
+    array = scratch.get(name)
+    if array is None or array.shape != shape or array.dtype != dtype:
+        array = scratch[name] = np.empty(shape, dtype=dtype)
+    array.fill(fill)
+    return array
+
+def _walk_selected(parent_r, added, k, r):
+    """
+    Walk the parent pointers of the classical DP back from cell (k, r).
+
+    Parameters:
+    - parent_r: Table of parent capacities, one per DP cell.
+    - added: Table of the item added at each DP cell (-1 if none).
+    - k: Row (number of items considered) to start from.
+    - r: Capacity to start from.
+
+    Yields:
+    - The indices of the items selected along the path to cell (k, r).
+    """
+    while k > 0:
+        j = added[k, r]
+        if j >= 0:
+            yield int(j)
+        r = parent_r[k, r]
+        k -= 1
+
+def _linear_knapsack(weights, values, capacity, dtype, scratch=None):
+    """
+    0/1 knapsack DP for QKP instances without interaction profits.
+
+    Gives the same result as the classical DP: a cell is only overwritten when
+    including the item strictly improves it, and the best capacity is the first
+    maximum of the last row.
+
+    Parameters:
+    - weights: int64 array of item weights.
+    - values: Array of item self-profits (the diagonal of the profit matrix).
+    - capacity: Knapsack capacity.
+    - dtype: Data type of the DP array.
+    - scratch: Optional dictionary of buffers reused across calls (see `_scratch_array`).
+
+    Returns:
+    - selected_items: A set of selected item indices.
+    - max_profit: The total profit achieved by the selected items.
+    """
+    n = weights.shape[0]
+    dp = _scratch_array(scratch, "linear_dp", (capacity + 1,), dtype, 0)
+    # Whether item k was included at each capacity, for backtracking
+    take = _scratch_array(scratch, "take", (n, capacity + 1), np.bool_, False)
+
+    for k in range(n):
+        w_k = int(weights[k])
+        if w_k > capacity:
+            continue
+        # Backward update: every capacity reads the state before item k, i.e. the left slice
+        candidate = dp[:capacity + 1 - w_k] + values[k]
+        improved = candidate > dp[w_k:]
+        take[k, w_k:] = improved
+        dp[w_k:] = np.where(improved, candidate, dp[w_k:])
+
+    best_r = int(np.argmax(dp))
+    max_profit = dp[best_r]
+    selected_items = set()
+    r = best_r
+    for k in range(n - 1, -1, -1):
+        if take[k, r]:
+            selected_items.add(k)
+            r -= int(weights[k])
+
+    return selected_items, float(max_profit)
+
+def classical_dp_qkp(weights, profits, capacity, scratch=None):
     """
     Classical DP for QKP with backtracking to retrieve the selected items.
 
@@ -8,53 +100,160 @@ def classical_dp_qkp(weights, profits, capacity):
     - weights: List of item weights.
     - profits: Quadratic profit matrix.
     - capacity: Knapsack capacity.
+    - scratch: Optional dictionary of buffers reused across calls (see `_scratch_array`).
 
     Returns:
     - selected_items: A set of selected item indices.
     - max_profit: The total profit achieved by the selected items.
     """
     n = len(weights)
+    w = np.ascontiguousarray(weights, dtype=np.int64).reshape(n)
+    P = np.ascontiguousarray(profits).reshape(n, n)
+    # Whether item k has a nonzero interaction with any earlier item
+    interacts = np.tril(P, -1).any(axis=1)
+    dtype = np.result_type(P.dtype, np.int64)
+    # Integer sums do not depend on the order of the terms
+    exact = np.issubdtype(dtype, np.integer)
+
+    # Without interactions, the problem is a linear 0/1 knapsack on the self-profits
+    if not interacts.any():
+        return _linear_knapsack(w, np.diag(P), capacity, dtype, scratch)
 
-    # DP table
-    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
-    # Tracker for backtracking
-    tracker = [[set() for _ in range(capacity + 1)] for _ in range(n + 1)]
+    # Parent pointers for backtracking: previous capacity and the item added (-1 if none)
+    parent_r = _scratch_array(scratch, "parent_r", (n + 1, capacity + 1), np.int32, -1)
+    added = _scratch_array(scratch, "added", (n + 1, capacity + 1), np.int32, -1)
 
-    # Populate the DP table
+    capacities = list(range(capacity + 1))
+
+    # Rolling rows of the DP as Python lists, which index faster than numpy scalars: the
+    # profits, integer-valued for integer profits, and the items selected per cell as int
+    # bitmasks (bit j set if item j is selected). The masks give the interaction sum in
+    # O(|S|) per cell; the parent pointers are only walked once, to reconstruct the final
+    # selection, so only the last row of profits is kept.
+    dp_prev = np.zeros(capacity + 1, dtype=dtype).tolist()
+    masks_prev = [0] * (capacity + 1)
+
+    # Populate the DP row by row
     for k in range(1, n + 1):
-        for r in range(capacity + 1):
-            # Case 1: Do not include item k-1
-            dp[k][r] = dp[k - 1][r]
-            tracker[k][r] = tracker[k - 1][r].copy()
+        # Loop invariants for item k-1
+        w_k = int(w[k - 1])
+        p_row = P[k - 1].tolist()
+        p_kk = p_row[k - 1]
+        interacts_k = interacts[k - 1]
+        bit = 1 << (k - 1)
+        # Interaction profits of item k-1 with each distinct selection seen in this row:
+        # their sum for integer profits, the individual terms for float profits
+        scores = {}
+
+        # Case 1: Do not include item k-1 (whole row at once)
+        dp_row = dp_prev.copy()
+        masks_row = masks_prev.copy()
+        parent_row = capacities.copy()
+        added_row = [-1] * (capacity + 1)
 
-            # Case 2: Include item k-1 if it fits
-            if r >= weights[k - 1]:
-                prev_r = r - weights[k - 1]
+        # Case 2: Include item k-1 where it fits
+        for r in range(w_k, capacity + 1):
+            prev_r = r - w_k
 
-                # Calculate profit with item k-1 included
-                profit_with_k = dp[k - 1][prev_r]  # Base profit from previous state
+            # Calculate profit with item k-1 included
+            profit_with_k = dp_prev[prev_r]  # Base profit from previous state
 
-                # Add self-profit (can be zero, doesn't affect calculations)
-                profit_with_k += profits[k - 1][k - 1]
+            # Add self-profit (can be zero, doesn't affect calculations)
+            profit_with_k += p_kk
 
-                # Add interaction profits with previously selected items
-                for j in tracker[k - 1][prev_r]:
-                    profit_with_k += profits[k - 1][j]
+            # Add interaction profits with previously selected items
+            if interacts_k:
+                mask = masks_prev[prev_r]
+                score = scores.get(mask)
+                if score is None:
+                    terms = tuple(p_row[j] for j in _mask_items(mask))
+                    score = scores[mask] = sum(terms) if exact else terms
+                if exact:
+                    profit_with_k += score
+                else:
+                    # Float profits are added one at a time, in item order, so the
+                    # rounding (and with it near-tie decisions) stays the same
+                    for p_kj in score:
+                        profit_with_k += p_kj
 
-                # Update DP table and tracker if this inclusion gives a higher profit
-                if profit_with_k > dp[k][r]:
-                    dp[k][r] = profit_with_k
-                    tracker[k][r] = tracker[k - 1][prev_r].copy()
-                    tracker[k][r].add(k - 1)
+            # Update the DP row and parent pointers if this inclusion gives a higher profit
+            if profit_with_k > dp_row[r]:
+                dp_row[r] = profit_with_k
+                masks_row[r] = masks_prev[prev_r] | bit
+                parent_row[r] = prev_r
+                added_row[r] = k - 1
+
+        parent_r[k] = parent_row
+        added[k] = added_row
+        dp_prev, masks_prev = dp_row, masks_row
 
     # Retrieve the maximum profit and the corresponding items
-    max_profit = max(dp[n])
-    max_capacity = dp[n].index(max_profit)
-    selected_items = tracker[n][max_capacity]
+    max_profit = max(dp_prev)
+    max_capacity = dp_prev.index(max_profit)
+    selected_items = set(_walk_selected(parent_r, added, n, max_capacity))
 
     return selected_items, float(max_profit)
 
-def dp_heuristic_algo2(weights, profits, capacity):
+def _mask_items(mask):
+    """
+    Iterate over the item indices encoded in a selected-items bitmask.
+
+    Parameters:
+    - mask: Bitmask with bit j set if item j is selected.
+
+    Yields:
+    - The indices of the set bits, lowest first.
+    """
+    mask = int(mask)
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def _intern_selection(mask, items, ids, masks, selections):
+    """
+    Return the ID of a selection, interning it on first use.
+
+    Parameters:
+    - mask: Bitmask with bit j set if item j is selected.
+    - items: Tuple of the selected item indices.
+    - ids: Dictionary mapping interned masks to their IDs.
+    - masks: List of interned masks, indexed by ID.
+    - selections: List of the item tuples of the interned masks, indexed by ID.
+
+    Returns:
+    - The ID of `mask`.
+    """
+    selection_id = ids.get(mask)
+    if selection_id is None:
+        selection_id = ids[mask] = len(masks)
+        masks.append(mask)
+        selections.append(items)
+    return selection_id
+
+def _profit_matrix(profits, n):
+    """
+    Convert a profit matrix for the heuristics, choosing the DP value type.
+
+    Integer profits keep integer DP values, with a large negative sentinel for
+    unreachable states instead of -inf (halved so additions cannot overflow).
+
+    Parameters:
+    - profits: Quadratic profit matrix.
+    - n: Number of items.
+
+    Returns:
+    - (P, unreachable): The n x n profit matrix as int64 or float64, and the
+      value marking unreachable DP states in that type.
+    """
+    P = np.asarray(profits)
+    if np.issubdtype(P.dtype, np.integer) or P.dtype == np.bool_:
+        dtype, unreachable = np.int64, np.iinfo(np.int64).min // 2
+    else:
+        dtype, unreachable = np.float64, -np.inf
+    return np.ascontiguousarray(P, dtype=dtype).reshape(n, n), dtype(unreachable)
+
+def dp_heuristic_algo2(weights, profits, capacity, scratch=None):
     """
     Heuristic DP algorithm 2 that tracks selected items to account for quadratic profits.
 
@@ -62,46 +261,240 @@ def dp_heuristic_algo2(weights, profits, capacity):
     - weights: List of item weights.
     - profits: Quadratic profit matrix.
     - capacity: Knapsack capacity.
+    - scratch: Optional dictionary of buffers reused across calls (see `_scratch_array`).
 
     Returns:
     - selected_items: A set of selected item indices.
     - max_profit: The total profit achieved by the selected items.
     """
     n = len(weights)
-    dp = np.full((n + 1, capacity + 1), -np.inf)
-    selected_items = [[set() for _ in range(capacity + 1)] for _ in range(n + 1)]
-    dp[0][0] = 0
+    w = np.ascontiguousarray(weights, dtype=np.int64).reshape(n)
+    P, unreachable = _profit_matrix(profits, n)
+    # Whether item k has a nonzero interaction with any earlier item
+    interacts = np.tril(P, -1).any(axis=1)
+    # Only rows k-1 and k are live, so a single row stored between items replaces the full table
+    dp = _scratch_array(scratch, "dp", (capacity + 1,), P.dtype, unreachable)
+    dp[0] = 0
+    # Selected items per DP cell, as IDs of interned selections
+    ids = _scratch_array(scratch, "ids", (capacity + 1,), np.int32, 0)
+    # Selections live in the current rows, interned: Python int bitmasks (bit j set if item j
+    # is selected, no width limit) and their item tuples, with ID 0 for the empty selection.
+    # The table is compacted after every row, so it never outgrows the 2 * (capacity + 1) cells.
+    selection_ids = {0: 0}
+    selection_masks = [0]
+    selection_items = [()]
+    unreachable = unreachable.item()
 
     for k in range(1, n + 1):
-        for r in range(capacity + 1):
-            # Not taking item k-1
-            dp[k][r] = dp[k - 1][r]
-            selected_items[k][r] = selected_items[k - 1][r].copy()
-
-            # Taking item k-1
-            if r >= weights[k - 1]:
-                prev_r = r - weights[k - 1]
-                prev_profit = dp[k - 1][prev_r]
-                if prev_profit != -np.inf:
-                    # Calculate new profit: p_i + sum of q_{i,j} for all j in selected_items[k-1][prev_r]
-                    current_profit = prev_profit + profits[k - 1][k - 1]
-                    for i in selected_items[k - 1][prev_r]:
-                        current_profit += profits[k - 1][i]
-
-                    # Update profit and items (with tie-breaking)
-                    if current_profit > dp[k][r] or (
-                        current_profit == dp[k][r] and len(selected_items[k - 1][prev_r]) + 1 > len(selected_items[k][r])
-                    ):
-                        dp[k][r] = current_profit
-                        selected_items[k][r] = selected_items[k - 1][prev_r].copy()
-                        selected_items[k][r].add(k - 1)
-
-    # Find the maximum profit and corresponding weight
-    best_r = np.argmax(dp[n])  # Optimized result extraction
-    max_profit = dp[n][best_r]
-    return selected_items[n][best_r], max_profit
-
-def dp_heuristic_algo3(weights, profits, capacity):
+        # Loop invariants for item k-1
+        w_k = int(w[k - 1])
+        p_row = P[k - 1].tolist()
+        p_kk = p_row[k - 1]
+        interacts_k = interacts[k - 1]
+        bit = 1 << (k - 1)
+        # Interaction sum of item k-1 with each selection of row k-1, computed on first use
+        scores = [None] * len(selection_masks)
+
+        # The inner loop runs on Python lists, which index faster than numpy scalars
+        dp_prev = dp.tolist()
+        ids_prev = ids.tolist()
+        # Not taking item k-1 (whole row at once)
+        dp_curr = dp_prev.copy()
+        ids_curr = ids_prev.copy()
+
+        # Taking item k-1 where it fits
+        for r in range(w_k, capacity + 1):
+            prev_r = r - w_k
+            prev_profit = dp_prev[prev_r]
+            if prev_profit != unreachable:
+                # Calculate new profit: p_i + sum of q_{i,j} for all j in the selection at prev_r
+                prev_id = ids_prev[prev_r]
+                current_profit = prev_profit + p_kk
+                if interacts_k:
+                    score = scores[prev_id]
+                    if score is None:
+                        score = scores[prev_id] = sum(map(p_row.__getitem__, selection_items[prev_id]))
+                    current_profit += score
+
+                # Update profit and items (with tie-breaking)
+                if current_profit > dp_curr[r] or (
+                    current_profit == dp_curr[r]
+                    and len(selection_items[prev_id]) + 1 > len(selection_items[ids_curr[r]])
+                ):
+                    dp_curr[r] = current_profit
+                    ids_curr[r] = _intern_selection(
+                        selection_masks[prev_id] | bit,
+                        selection_items[prev_id] + (k - 1,),
+                        selection_ids,
+                        selection_masks,
+                        selection_items,
+                    )
+
+        # Row k becomes the previous row; drop the selections no cell refers to any more
+        dp[:] = dp_curr
+        live, ids[:] = np.unique(np.asarray(ids_curr, dtype=np.int32), return_inverse=True)
+        live = live.tolist()
+        selection_masks = [selection_masks[i] for i in live]
+        selection_items = [selection_items[i] for i in live]
+        selection_ids = {mask: i for i, mask in enumerate(selection_masks)}
+
+    # Find the maximum profit and corresponding weight (dp now holds row n)
+    best_r = int(np.argmax(dp))  # Optimized result extraction
+    max_profit = dp[best_r]
+    return set(_mask_items(selection_masks[ids[best_r]])), float(max_profit)
+
+def _dp3_core(weights, profits, capacity, dp, masks, unreachable):
+    """
+    Backward-update sweep of DP heuristic algorithm 3 on numpy arrays.
+
+    Parameters:
+    - weights: int64 array of item weights.
+    - profits: int64 or float64 quadratic profit matrix.
+    - capacity: Knapsack capacity.
+    - dp: Array of the profit reached at each capacity (same type as `profits`), updated in place.
+    - masks: uint64 array of the items included at each capacity, updated in place.
+    - unreachable: Value of `dp` at capacities that cannot be reached.
+    """
+    n = weights.shape[0]
+    one = np.uint64(1)
+
+    for k in range(n):
+        # Loop invariants for item k
+        w_k = weights[k]
+        p_kk = profits[k, k]
+        bit = one << np.uint64(k)
+
+        for r in range(capacity, w_k - 1, -1):  # Backward update
+            prev_r = r - w_k
+            if dp[prev_r] != unreachable:  # Ensure previous state is valid
+                # Calculate new profit: p_k + sum of q_{k,j} for all j in masks[prev_r]
+                current_profit = dp[prev_r] + p_kk
+                prev_size = 0
+                m = masks[prev_r]
+                j = 0
+                while m:
+                    if m & one:
+                        current_profit += profits[k, j]
+                        prev_size += 1
+                    m >>= one
+                    j += 1
+
+                if current_profit > dp[r]:
+                    improved = True
+                elif current_profit == dp[r]:
+                    # Tie-breaking: prefer the larger selection
+                    size = 0
+                    m = masks[r]
+                    while m:
+                        size += int(m & one)
+                        m >>= one
+                    improved = prev_size + 1 > size
+                else:
+                    improved = False
+
+                if improved:
+                    dp[r] = current_profit
+                    masks[r] = masks[prev_r] | bit
+
+def _dp3_vectorized(weights, profits, capacity, dp, masks, unreachable):
+    """
+    Backward-update sweep of DP heuristic algorithm 3, vectorized across capacities.
+
+    Every capacity r only reads r - w_k, which the backward update has not
+    touched yet, so each item can be applied to all capacities at once from
+    the left slice of the previous state.
+
+    Parameters:
+    - weights: int64 array of item weights.
+    - profits: int64 or float64 quadratic profit matrix.
+    - capacity: Knapsack capacity.
+    - dp: Array of the profit reached at each capacity (same type as `profits`), updated in place.
+    - masks: uint64 array of the items included at each capacity, updated in place.
+    - unreachable: Value of `dp` at capacities that cannot be reached.
+    """
+    n = weights.shape[0]
+    shifts = np.arange(n, dtype=np.uint64)
+
+    for k in range(n):
+        w_k = int(weights[k])
+        if w_k > capacity:
+            continue
+        prev_dp = dp[:capacity + 1 - w_k]
+        prev_masks = masks[:capacity + 1 - w_k]
+        cur_dp = dp[w_k:]
+        cur_masks = masks[w_k:]
+
+        # Score each distinct mask against item k once, then spread the scores over capacities.
+        # The masks are unpacked into 0/1 rows so the scores come from a single product.
+        distinct, where = np.unique(prev_masks, return_inverse=True)
+        distinct_bits = (distinct[:, None] >> shifts) & np.uint64(1)
+        interaction = distinct_bits.astype(profits.dtype) @ profits[k]
+        candidate = prev_dp + profits[k, k] + interaction[where]
+
+        # Tie-breaking: prefer the larger selection
+        tie = candidate == cur_dp
+        ties = np.flatnonzero(tie)
+        if ties.size:
+            prev_sizes = distinct_bits.sum(axis=1)[where[ties]]
+            cur_sizes = ((cur_masks[ties, None] >> shifts) & np.uint64(1)).sum(axis=1)
+            tie[ties] = prev_sizes + 1 > cur_sizes
+        improved = (prev_dp != unreachable) & ((candidate > cur_dp) | tie)
+
+        new_masks = np.where(improved, prev_masks | (np.uint64(1) << np.uint64(k)), cur_masks)
+        dp[w_k:] = np.where(improved, candidate, cur_dp)
+        masks[w_k:] = new_masks
+
+def _dp3_wide(weights, profits, capacity, dp, masks, unreachable):
+    """
+    Backward-update sweep of DP heuristic algorithm 3 for more than 64 items.
+
+    Same sweep as `_dp3_core`, but on Python lists, with the included items
+    encoded as Python int bitmasks, which have no width limit.
+
+    Parameters:
+    - weights: int64 array of item weights.
+    - profits: int64 or float64 quadratic profit matrix.
+    - capacity: Knapsack capacity.
+    - dp: Array of the profit reached at each capacity (same type as `profits`), updated in place.
+    - masks: List of the int bitmasks of the items included at each capacity, updated in place.
+    - unreachable: Value of `dp` at capacities that cannot be reached.
+    """
+    n = weights.shape[0]
+    values = dp.tolist()
+    unreachable = unreachable.item()
+
+    for k in range(n):
+        # Loop invariants for item k
+        w_k = int(weights[k])
+        p_row = profits[k].tolist()
+        p_kk = p_row[k]
+        bit = 1 << k
+
+        for r in range(capacity, w_k - 1, -1):  # Backward update
+            prev_r = r - w_k
+            if values[prev_r] != unreachable:  # Ensure previous state is valid
+                # Calculate new profit: p_k + sum of q_{k,j} for all j in masks[prev_r]
+                prev_mask = masks[prev_r]
+                current_profit = values[prev_r] + p_kk
+                for j in _mask_items(prev_mask):
+                    current_profit += p_row[j]
+
+                # Update values[r] and item inclusion with tie-breaking
+                if current_profit > values[r] or (
+                    current_profit == values[r] and bin(prev_mask).count("1") + 1 > bin(masks[r]).count("1")
+                ):
+                    values[r] = current_profit
+                    masks[r] = prev_mask | bit
+
+    dp[:] = values
+
+if njit is not None:
+    _dp3_core = njit(cache=True)(_dp3_core)
+else:
+    # Interpreted, the scalar loop is far slower than a NumPy pass per item
+    _dp3_core = _dp3_vectorized
+
+def dp_heuristic_algo3(weights, profits, capacity, scratch=None):
     """
     DP heuristic algorithm 3 that approximates quadratic profits
 
@@ -109,43 +502,35 @@ def dp_heuristic_algo3(weights, profits, capacity):
     - weights: List of item weights.
     - profits: Quadratic profit matrix.
     - capacity: Knapsack capacity.
+    - scratch: Optional dictionary of buffers reused across calls (see `_scratch_array`).
 
     Returns:
     - selected_items: A set of selected item indices.
     - max_profit: The total profit achieved by the selected items.
     """
     n = len(weights)
-    dp = np.full(capacity + 1, -np.inf)
-    item_inclusion = [set() for _ in range(capacity + 1)]
+    w = np.ascontiguousarray(weights, dtype=np.int64).reshape(n)
+    P, unreachable = _profit_matrix(profits, n)
+    dp = _scratch_array(scratch, "dp", (capacity + 1,), P.dtype, unreachable)
     dp[0] = 0  # Base case: zero capacity, zero profit
+    if n <= 64:
+        masks = _scratch_array(scratch, "masks", (capacity + 1,), np.uint64, 0)
+        _dp3_core(w, P, int(capacity), dp, masks, unreachable)
+    else:
+        # uint64 masks cannot hold more than 64 items
+        masks = [0] * (capacity + 1)
+        _dp3_wide(w, P, int(capacity), dp, masks, unreachable)
 
-    for k in range(n):
-        for r in range(capacity, weights[k] - 1, -1):  # Backward update
-            prev_r = r - weights[k]
-            if dp[prev_r] != -np.inf:  # Ensure previous state is valid
-                # Calculate new profit: p_k + sum of q_{k,j} for all j in item_inclusion[prev_r]
-                current_profit = dp[prev_r] + profits[k][k]
-                for j in item_inclusion[prev_r]:
-                    current_profit += profits[k][j]
-
-                # Update dp[r] and item inclusion with tie-breaking
-                if current_profit > dp[r] or (
-                    current_profit == dp[r] and len(item_inclusion[prev_r]) + 1 > len(item_inclusion[r])
-                ):
-                    dp[r] = current_profit
-                    item_inclusion[r] = item_inclusion[prev_r].copy()
-                    item_inclusion[r].add(k)
-
-    max_profit = np.max(dp)
-    best_r = np.argmax(dp)
-    selected_items = item_inclusion[best_r]
-    return selected_items, max_profit
+    best_r = int(np.argmax(dp))
+    max_profit = dp[best_r]
+    selected_items = set(_mask_items(masks[best_r]))
+    return selected_items, float(max_profit)
 
-def run_classical_dp(weights, profits, capacity):
-    return classical_dp_qkp(weights, profits, capacity)
+def run_classical_dp(weights, profits, capacity, scratch=None):
+    return classical_dp_qkp(weights, profits, capacity, scratch)
 
-def run_heuristic_algo2(weights, profits, capacity):
-    return dp_heuristic_algo2(weights, profits, capacity)
+def run_heuristic_algo2(weights, profits, capacity, scratch=None):
+    return dp_heuristic_algo2(weights, profits, capacity, scratch)
 
-def run_heuristic_algo3(weights, profits, capacity):
-    return dp_heuristic_algo3(weights, profits, capacity)
+def run_heuristic_algo3(weights, profits, capacity, scratch=None):
+    return dp_heuristic_algo3(weights, profits, capacity, scratch)
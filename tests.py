@@ -1,7 +1,173 @@
+import ast
+import os
+import subprocess
+import sys
+
+import numpy as np
+
 from algorithms import classical_dp_qkp, dp_heuristic_algo2, dp_heuristic_algo3
+import utils
 from utils import compute_profit_and_items, measure_complexity
 from algorithms import run_classical_dp, run_heuristic_algo2, run_heuristic_algo3
 
+TEST_CASES = [
+    # Format: (weights, profits, capacity, expected_selected_items, expected_profit)
+
+    # Test Case 1: Basic small problem
+    {
+        'weights': [3, 4, 5],
+        'profits': [
+            [10, 2, 3],
+            [2, 5, 4],
+            [3, 4, 7]
+        ],
+        'capacity': 7,
+        'expected_selected_items': {0, 1},  # Items 0 and 1
+        'expected_profit': 10 + 5 + 2  # Total = 17
+    },
+
+    # Test Case 2: Symmetric profits with moderate capacity
+    {
+        'weights': [2, 3, 4],
+        'profits': [
+            [5, 3, 1],
+            [3, 8, 4],
+            [1, 4, 6]
+        ],
+        'capacity': 6,
+        'expected_selected_items': {0, 1},  # Optimal selection within capacity
+        'expected_profit': 5 + 8 + 3  # Total = 16
+    },
+
+    # Test Case 3: Larger problem with diverse weights
+    {
+        'weights': [2, 3, 4, 5],
+        'profits': [
+            [6, 2, 4, 1],
+            [2, 5, 3, 2],
+            [4, 3, 8, 5],
+            [1, 2, 5, 9]
+        ],
+        'capacity': 10,
+        'expected_selected_items': {0, 1, 2},  # Items 0, 1, 2
+        'expected_profit': 6 + 5 + 8 + 2 + 4 + 3 # Total = 28
+    },
+
+    # Test Case 4: Sparse profits, only diagonal terms matter
+    {
+        'weights': [1, 3, 4, 2],
+        'profits': [
+            [7, 0, 0, 0],
+            [0, 8, 0, 0],
+            [0, 0, 9, 0],
+            [0, 0, 0, 10]
+        ],
+        'capacity': 5,
+        'expected_selected_items': {1, 3},  # Items 1 and 3
+        'expected_profit': 8 + 10  # Total = 18
+    },
+
+    # Test Case 5: Dense quadratic terms
+    {
+        'weights': [3, 2, 4, 3],
+        'profits': [
+            [5, 2, 4, 1],
+            [2, 6, 3, 2],
+            [4, 3, 8, 5],
+            [1, 2, 5, 7]
+        ],
+        'capacity': 9,
+        'expected_selected_items': {1, 2, 3},  # Items 1, 2, 3
+        'expected_profit': 6 + 8 + 7 + 3 + 2 + 5  # Total = 31
+    },
+
+    # Test Case 6: High self-profits with weak interactions
+    {
+        'weights': [2, 3, 4, 1],
+        'profits': [
+            [15, 1, 2, 1],
+            [1, 20, 2, 1],
+            [2, 2, 25, 3],
+            [1, 1, 3, 10]
+        ],
+        'capacity': 7,
+        'expected_selected_items': {0, 2, 3},  # Items 0, 2, 3
+        'expected_profit': 15 + 25 + 10 + 2 + 1 + 3  # Total = 56
+    },
+
+    # Test Case 7: Complex asymmetric profits
+    {
+        'weights': [3, 4, 2, 5],
+        'profits': [
+            [10, 5, 3, 7],
+            [5, 15, 8, 2],
+            [3, 8, 12, 6],
+            [7, 2, 6, 20]
+        ],
+        'capacity': 10,
+        'expected_selected_items': {0, 2, 3},  # Items 0, 2, 3
+        'expected_profit': 10 + 12 + 20 + 3 + 7 + 6  # Total = 58
+    },
+
+    # Test Case 8: Edge case - Capacity too small to hold any item
+    {
+        'weights': [5, 4, 6, 7],
+        'profits': [
+            [10, 2, 3, 4],
+            [2, 5, 4, 6],
+            [3, 4, 7, 1],
+            [4, 6, 1, 9]
+        ],
+        'capacity': 2,
+        'expected_selected_items': set(),  # No items can be selected
+        'expected_profit': 0
+    },
+
+    # Test Case 9: Edge case - All weights 1 (favoring dense packing)
+    {
+        'weights': [1, 1, 1, 1, 1],
+        'profits': [
+            [1, 2, 3, 4, 5],
+            [2, 6, 7, 8, 9],
+            [3, 7, 12, 13, 14],
+            [4, 8, 13, 15, 16],
+            [5, 9, 14, 16, 18]
+        ],
+        'capacity': 3,
+        'expected_selected_items': {2, 3, 4},  # Items 2, 3, 4
+        'expected_profit': 12 + 15 + 18 + 13 + 14 + 16  # Total = 88
+    },
+
+    # Test Case 10: Large and sparse problem
+    {
+        'weights': [1, 3, 2, 4, 6, 5],
+        'profits': [
+            [10, 5, 0, 0, 0, 0],  
+            [5, 15, 8, 0, 0, 0], 
+            [0, 8, 12, 6, 0, 0],  
+            [0, 0, 6, 20, 5, 0],  
+            [0, 0, 0, 5, 30, 10],
+            [0, 0, 0, 0, 10, 25] 
+        ],
+        'capacity': 7,  # Strict capacity ensures competing subsets cannot fit
+        'expected_selected_items': {0, 1, 2},  # Items 0, 1, 2
+        'expected_profit': 10 + 15 + 12 + 5 + 8  # Total = 50
+    },
+
+    # Test Case 11: Fractional profits
+    {
+        'weights': [2, 3, 4],
+        'profits': [
+            [4.5, 1.25, 0.5],
+            [1.25, 6.0, 2.5],
+            [0.5, 2.5, 7.75]
+        ],
+        'capacity': 7,
+        'expected_selected_items': {1, 2},  # Items 1 and 2
+        'expected_profit': 6.0 + 7.75 + 2.5  # Total = 16.25
+    }
+]
+
 def test_qkp_algorithms():
     """
     Tests various algorithms for the Quadratic Knapsack Problem using predefined test cases.
@@ -46,152 +212,7 @@ def test_qkp_algorithms():
     Returns:
     - None
     """
-    test_cases = [
-        # Format: (weights, profits, capacity, expected_selected_items, expected_profit)
-
-        # Test Case 1: Basic small problem
-        {
-            'weights': [3, 4, 5],
-            'profits': [
-                [10, 2, 3],
-                [2, 5, 4],
-                [3, 4, 7]
-            ],
-            'capacity': 7,
-            'expected_selected_items': {0, 1},  # Items 0 and 1
-            'expected_profit': 10 + 5 + 2  # Total = 17
-        },
-
-        # Test Case 2: Symmetric profits with moderate capacity
-        {
-            'weights': [2, 3, 4],
-            'profits': [
-                [5, 3, 1],
-                [3, 8, 4],
-                [1, 4, 6]
-            ],
-            'capacity': 6,
-            'expected_selected_items': {0, 1},  # Optimal selection within capacity
-            'expected_profit': 5 + 8 + 3  # Total = 16
-        },
-
-        # Test Case 3: Larger problem with diverse weights
-        {
-            'weights': [2, 3, 4, 5],
-            'profits': [
-                [6, 2, 4, 1],
-                [2, 5, 3, 2],
-                [4, 3, 8, 5],
-                [1, 2, 5, 9]
-            ],
-            'capacity': 10,
-            'expected_selected_items': {0, 1, 2},  # Items 0, 1, 2
-            'expected_profit': 6 + 5 + 8 + 2 + 4 + 3 # Total = 28
-        },
-
-        # Test Case 4: Sparse profits, only diagonal terms matter
-        {
-            'weights': [1, 3, 4, 2],
-            'profits': [
-                [7, 0, 0, 0],
-                [0, 8, 0, 0],
-                [0, 0, 9, 0],
-                [0, 0, 0, 10]
-            ],
-            'capacity': 5,
-            'expected_selected_items': {1, 3},  # Items 1 and 3
-            'expected_profit': 8 + 10  # Total = 18
-        },
-
-        # Test Case 5: Dense quadratic terms
-        {
-            'weights': [3, 2, 4, 3],
-            'profits': [
-                [5, 2, 4, 1],
-                [2, 6, 3, 2],
-                [4, 3, 8, 5],
-                [1, 2, 5, 7]
-            ],
-            'capacity': 9,
-            'expected_selected_items': {1, 2, 3},  # Items 1, 2, 3
-            'expected_profit': 6 + 8 + 7 + 3 + 2 + 5  # Total = 31
-        },
-
-        # Test Case 6: High self-profits with weak interactions
-        {
-            'weights': [2, 3, 4, 1],
-            'profits': [
-                [15, 1, 2, 1],
-                [1, 20, 2, 1],
-                [2, 2, 25, 3],
-                [1, 1, 3, 10]
-            ],
-            'capacity': 7,
-            'expected_selected_items': {0, 2, 3},  # Items 0, 2, 3
-            'expected_profit': 15 + 25 + 10 + 2 + 1 + 3  # Total = 56
-        },
-
-        # Test Case 7: Complex asymmetric profits
-        {
-            'weights': [3, 4, 2, 5],
-            'profits': [
-                [10, 5, 3, 7],
-                [5, 15, 8, 2],
-                [3, 8, 12, 6],
-                [7, 2, 6, 20]
-            ],
-            'capacity': 10,
-            'expected_selected_items': {0, 2, 3},  # Items 0, 2, 3
-            'expected_profit': 10 + 12 + 20 + 3 + 7 + 6  # Total = 58
-        },
-
-        # Test Case 8: Edge case - Capacity too small to hold any item
-        {
-            'weights': [5, 4, 6, 7],
-            'profits': [
-                [10, 2, 3, 4],
-                [2, 5, 4, 6],
-                [3, 4, 7, 1],
-                [4, 6, 1, 9]
-            ],
-            'capacity': 2,
-            'expected_selected_items': set(),  # No items can be selected
-            'expected_profit': 0
-        },
-
-        # Test Case 9: Edge case - All weights 1 (favoring dense packing)
-        {
-            'weights': [1, 1, 1, 1, 1],
-            'profits': [
-                [1, 2, 3, 4, 5],
-                [2, 6, 7, 8, 9],
-                [3, 7, 12, 13, 14],
-                [4, 8, 13, 15, 16],
-                [5, 9, 14, 16, 18]
-            ],
-            'capacity': 3,
-            'expected_selected_items': {2, 3, 4},  # Items 2, 3, 4
-            'expected_profit': 12 + 15 + 18 + 13 + 14 + 16  # Total = 88
-        },
-
-        # Test Case 10: Large and sparse problem
-        {
-            'weights': [1, 3, 2, 4, 6, 5],
-            'profits': [
-                [10, 5, 0, 0, 0, 0],  
-                [5, 15, 8, 0, 0, 0], 
-                [0, 8, 12, 6, 0, 0],  
-                [0, 0, 6, 20, 5, 0],  
-                [0, 0, 0, 5, 30, 10],
-                [0, 0, 0, 0, 10, 25] 
-            ],
-            'capacity': 7,  # Strict capacity ensures competing subsets cannot fit
-            'expected_selected_items': {0, 1, 2},  # Items 0, 1, 2
-            'expected_profit': 10 + 15 + 12 + 5 + 8  # Total = 50
-        }
-    ]
-
-    for idx, test in enumerate(test_cases, 1):
+    for idx, test in enumerate(TEST_CASES, 1):
         weights = test['weights']
         profits = test['profits']
         capacity = test['capacity']
@@ -243,6 +264,306 @@ def test_qkp_algorithms():
 
         print("-" * 70)
 
+def test_classical_dp_float_profits():
+    """
+    Tests that the Classical DP adds float interaction profits in item order.
+
+    Float additions round differently in a different order, which can flip a near-tie
+    between two selections of the same capacity and, through the items that follow,
+    the final selection. This instance is one where summing the interactions of each
+    selection at once selects items {0, 1, 3, 5} instead of {0, 1, 3, 4}.
+
+    Outputs:
+    - The correctness of the Classical DP on the instance.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    weights = [6, 1, 6, 4, 6, 8]
+    profits = [
+        [8.17, 7.33, 4.09, 4.9, 2.43, 9.23],
+        [7.33, 5.37, 3.1, 4.09, 5.13, 9.28],
+        [4.09, 3.1, 1.25, 6.79, 7.22, 0.35],
+        [4.9, 4.09, 6.79, 2.35, 8.73, 6.85],
+        [2.43, 5.13, 7.22, 8.73, 6.54, 2.68],
+        [9.23, 9.28, 0.35, 6.85, 2.68, 0.7]
+    ]
+    capacity = 20
+    expected_items = {0, 1, 3, 4}
+    expected_profit = 8.17 + 5.37 + 2.35 + 6.54 + 7.33 + 4.9 + 2.43 + 4.09 + 5.13 + 8.73  # Total = 55.04
+
+    items, profit = classical_dp_qkp(weights, profits, capacity)
+    correct = items == expected_items and abs(profit - expected_profit) < 1e-9
+
+    print("Classical DP Float Summation Order:")
+    print(f"  • Classical DP       : Profit = {profit}, Items = {items}, Correct: {'✅' if correct else '❌'}")
+    print("-" * 70)
+
+def test_measure_complexity_parallel():
+    """
+    Tests that measuring memory in a process pool gives the same averages as measuring
+    serially.
+
+    The pool is only used from `utils.PARALLEL_MIN_CELLS` DP cells on, which no test case
+    reaches, so the threshold is lowered for the duration of the test. The memory
+    averages must agree within 10%, as tracemalloc peaks vary slightly between
+    processes; the timed runs are serial either way. An algorithm that cannot be
+    pickled must fall back to serial measurement.
+
+    Outputs:
+    - The correctness of the parallel measurement for each algorithm.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    n, capacity = 20, 300
+    weights = [(7 * i) % 13 + 1 for i in range(n)]
+    profits = [[(i * j + i + j) % 7 for j in range(n)] for i in range(n)]
+    algorithms = {
+        "Classical DP": classical_dp_qkp,
+        "Heuristic Algo 2": dp_heuristic_algo2,
+        "Heuristic Algo 3": dp_heuristic_algo3
+    }
+    unpicklable = {"Unpicklable": lambda w, p, c: dp_heuristic_algo3(w, p, c)}
+
+    min_cells = utils.PARALLEL_MIN_CELLS
+    utils.PARALLEL_MIN_CELLS = 0
+    try:
+        parallel = measure_complexity(algorithms, weights, profits, capacity, runs=3, workers=2)
+        parallel.update(measure_complexity(unpicklable, weights, profits, capacity, runs=3, workers=2))
+    finally:
+        utils.PARALLEL_MIN_CELLS = min_cells
+    serial = measure_complexity(algorithms, weights, profits, capacity, runs=3, workers=1)
+    serial["Unpicklable"] = serial["Heuristic Algo 3"]
+
+    print("Parallel Complexity Analysis:")
+    for algo_name, stats in parallel.items():
+        expected_memory = serial[algo_name]['Avg Memory (MB)']
+        correct = (
+            stats['Runs'] == 3
+            and stats['Avg Time (seconds)'] > 0
+            and abs(stats['Avg Memory (MB)'] - expected_memory) <= 0.1 * expected_memory
+        )
+        print(f"  • {algo_name:19}: Memory = {stats['Avg Memory (MB)']:.6f} MB, Serial = {expected_memory:.6f} MB, Correct: {'✅' if correct else '❌'}")
+    print("-" * 70)
+
+def test_heuristic_algo3_without_numba():
+    """
+    Tests Heuristic Algorithm 3 without Numba installed, where its sweep over the
+    capacities runs in NumPy instead of in compiled code.
+
+    The algorithm is run on every predefined test case in a separate Python process
+    in which importing Numba fails, and its profits are compared to the expected ones.
+
+    Outputs:
+    - The correctness of the algorithm for each test case.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    script = (
+        "import sys\n"
+        "sys.modules['numba'] = None  # Makes `import numba` raise ImportError\n"
+        "from algorithms import dp_heuristic_algo3\n"
+        "from tests import TEST_CASES\n"
+        "print([dp_heuristic_algo3(test['weights'], test['profits'], test['capacity'])[1] for test in TEST_CASES])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+    profits = ast.literal_eval(result.stdout)
+
+    print("DP Heuristic Algo 3 without Numba:")
+    for idx, (test, profit) in enumerate(zip(TEST_CASES, profits), 1):
+        correct = profit == test['expected_profit']
+        print(f"  • Test Case {idx:2}: Profit = {profit}, Correct: {'✅' if correct else '❌'}")
+    print("-" * 70)
+
+def test_qkp_more_than_64_items():
+    """
+    Tests the algorithms on an instance with more items than fit in a 64-bit mask
+    of selected items.
+
+    All weights are 1 and item i has self-profit i + 1, with a single interaction
+    between the last two items, so the 10 last items are the best selection.
+
+    Outputs:
+    - The correctness of each algorithm on the instance.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    n = 70
+    weights = [1] * n
+    profits = [[i + 1 if i == j else 0 for j in range(n)] for i in range(n)]
+    profits[n - 2][n - 1] = profits[n - 1][n - 2] = 3
+    capacity = 10
+    expected_items = set(range(n - 10, n))  # Items 60 to 69
+    expected_profit = sum(range(n - 9, n + 1)) + 3  # Total = 658
+
+    print(f"{n} Items:")
+    for algo_name, algo in [("Classical DP", classical_dp_qkp), ("DP Heuristic Algo 2", dp_heuristic_algo2),
+                            ("DP Heuristic Algo 3", dp_heuristic_algo3)]:
+        items, profit = algo(weights, profits, capacity)
+        correct = profit == expected_profit and items == expected_items
+        print(f"  • {algo_name:19}: Profit = {profit}, Correct: {'✅' if correct else '❌'}")
+    print("-" * 70)
+
+def test_qkp_scratch_reuse():
+    """
+    Tests that reusing scratch buffers across calls does not change the results.
+
+    Each algorithm solves the predefined test cases, first in order and then in reverse,
+    with one scratch dictionary shared by all of its calls, so the buffers are reused
+    with larger and smaller capacities and with integer and float profits. Each result
+    must match the result of the same call without scratch buffers.
+
+    Outputs:
+    - The correctness of each algorithm with reused buffers.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    print("Scratch Buffer Reuse:")
+    for algo_name, algo in [("Classical DP", classical_dp_qkp), ("DP Heuristic Algo 2", dp_heuristic_algo2),
+                            ("DP Heuristic Algo 3", dp_heuristic_algo3)]:
+        scratch = {}
+        mismatches = 0
+        for test in TEST_CASES + TEST_CASES[::-1]:
+            args = (test['weights'], test['profits'], test['capacity'])
+            if algo(*args, scratch=scratch) != algo(*args):
+                mismatches += 1
+        print(f"  • {algo_name:19}: Mismatches = {mismatches}, Correct: {'✅' if mismatches == 0 else '❌'}")
+    print("-" * 70)
+
+def test_classical_dp_without_interactions():
+    """
+    Tests the Classical DP on profit matrices without interaction profits, which it
+    solves as a linear 0/1 knapsack on the self-profits.
+
+    Besides the optimal profit, the selected items must be the ones the full DP selects,
+    including between selections of equal profit: an item only replaces the current
+    selection if it strictly improves it, and the first capacity with the maximum profit
+    is kept.
+
+    Outputs:
+    - The correctness of the Classical DP for each test case.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    test_cases = [
+        # Test Case 4 of the predefined test cases: integer self-profits
+        TEST_CASES[3],
+
+        # Fractional self-profits
+        {
+            'weights': [2, 3, 1],
+            'profits': [
+                [3.5, 0, 0],
+                [0, 5.25, 0],
+                [0, 0, 1.5]
+            ],
+            'capacity': 4,
+            'expected_selected_items': {1, 2},  # Items 1 and 2
+            'expected_profit': 5.25 + 1.5  # Total = 6.75
+        },
+
+        # Ties: items 0 and 1 together are worth as much as item 2 alone
+        {
+            'weights': [1, 1, 2],
+            'profits': [
+                [3, 0, 0],
+                [0, 3, 0],
+                [0, 0, 6]
+            ],
+            'capacity': 2,
+            'expected_selected_items': {0, 1},  # Items 0 and 1, found before item 2
+            'expected_profit': 3 + 3  # Total = 6
+        },
+
+        # Ties: items 0, 1 and 2 are interchangeable
+        {
+            'weights': [2, 2, 2, 3],
+            'profits': [
+                [4, 0, 0, 0],
+                [0, 4, 0, 0],
+                [0, 0, 4, 0],
+                [0, 0, 0, 7]
+            ],
+            'capacity': 5,
+            'expected_selected_items': {0, 3},  # Items 0 and 3
+            'expected_profit': 4 + 7  # Total = 11
+        }
+    ]
+
+    print("Classical DP without Interactions:")
+    for idx, test in enumerate(test_cases, 1):
+        items, profit = classical_dp_qkp(test['weights'], test['profits'], test['capacity'])
+        correct = profit == test['expected_profit'] and items == test['expected_selected_items']
+        print(f"  • Test Case {idx}: Profit = {profit}, Items = {items}, Correct: {'✅' if correct else '❌'}")
+    print("-" * 70)
+
+def test_qkp_profit_types():
+    """
+    Tests that the algorithms give the same results for integer and float profit matrices.
+
+    Integer profits are solved with integer DP values and float profits with float DP
+    values. Each predefined test case with integer profits is solved with the profits
+    given as a list of Python ints, an int32 array and a float64 array; the results must
+    be identical, with the profit returned as a Python float.
+
+    Outputs:
+    - The correctness of each algorithm across profit types.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    print("Profit Types:")
+    for algo_name, algo in [("Classical DP", classical_dp_qkp), ("DP Heuristic Algo 2", dp_heuristic_algo2),
+                            ("DP Heuristic Algo 3", dp_heuristic_algo3)]:
+        mismatches = 0
+        for test in TEST_CASES:
+            if not all(isinstance(p, int) for row in test['profits'] for p in row):
+                continue
+            results = [
+                algo(test['weights'], profits, test['capacity'])
+                for profits in (test['profits'], np.array(test['profits'], dtype=np.int32),
+                                np.array(test['profits'], dtype=np.float64))
+            ]
+            if any(result != results[0] or type(result[1]) is not float for result in results):
+                mismatches += 1
+        print(f"  • {algo_name:19}: Mismatches = {mismatches}, Correct: {'✅' if mismatches == 0 else '❌'}")
+    print("-" * 70)
+
 if __name__ == "__main__":
     test_qkp_algorithms()
-    
\ No newline at end of file
+    test_classical_dp_float_profits()
+    test_measure_complexity_parallel()
+    test_heuristic_algo3_without_numba()
+    test_qkp_more_than_64_items()
+    test_qkp_scratch_reuse()
+    test_classical_dp_without_interactions()
+    test_qkp_profit_types()
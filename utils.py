@@ -1,7 +1,15 @@
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+import inspect
+import os
+import pickle
 import time
 import tracemalloc
 
+import numpy as np
+
+# Below this many DP cells (n * capacity), starting worker processes costs more than the memory runs
+PARALLEL_MIN_CELLS = 1_000_000
+
 def compute_profit_and_items(weights, profits, capacity, selected_indices):
     """
     Helper function to compute the total profit and validate the selected items 
@@ -18,65 +26,142 @@ def compute_profit_and_items(weights, profits, capacity, selected_indices):
         * total_profit: The computed profit for the selected items (or None if overweight).
         * valid_selected_items: The subset of selected items that fit within the capacity.
     """
-    total_weight = sum(weights[i] for i in selected_indices)
+    valid_selected_items = set(selected_indices)
+    idx = np.sort(np.fromiter(valid_selected_items, dtype=np.intp, count=len(valid_selected_items)))
+    total_weight = np.asarray(weights)[idx].sum()
     
     # Check if the total weight exceeds capacity
     if total_weight > capacity:
         return None, set()
     
-    total_profit = 0
-    valid_selected_items = set(selected_indices)
+    # Profit submatrix of the selected items
+    n = len(weights)
+    sub = np.asarray(profits).reshape(n, n)[np.ix_(idx, idx)]
     
-    # Add linear profits
-    for i in valid_selected_items:
-        total_profit += profits[i][i]
+    # Add linear profits (diagonal) and quadratic profits (each pair once, i < j)
+    total_profit = np.trace(sub) + np.triu(sub, 1).sum()
     
-    # Add quadratic profits
-    for i, j in combinations(valid_selected_items, 2):
-        total_profit += profits[i][j]
-    
-    return total_profit, valid_selected_items
+    return total_profit.item(), valid_selected_items
+
+def _accepts_scratch(algo):
+    """
+    Checks whether an algorithm takes a `scratch` keyword argument for reusable buffers.
+    """
+    try:
+        parameters = inspect.signature(algo).parameters.values()
+    except (TypeError, ValueError):  # No introspectable signature
+        return False
+    return any(
+        parameter.name == "scratch" or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+def _time_run(algo, weights, profits, capacity, scratch):
+    """
+    Runs an algorithm once and returns its execution time in seconds.
+
+    `scratch` is passed on only if it is not None.
+    """
+    start_time = time.perf_counter()
+    if scratch is None:
+        algo(weights, profits, capacity)
+    else:
+        algo(weights, profits, capacity, scratch=scratch)
+    end_time = time.perf_counter()
+    return end_time - start_time
+
+def _memory_run(algo, weights, profits, capacity):
+    """
+    Runs an algorithm once under tracemalloc and returns its peak memory usage in MB.
+
+    No scratch buffers are passed, so every run allocates its full DP state and the
+    peak reflects the algorithm's space use regardless of the number of runs.
+    """
+    tracemalloc.start()
+    algo(weights, profits, capacity)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 10**6  # Convert to MB
 
-def measure_complexity(algorithms, weights, profits, capacity, runs=5):
+def _picklable(algorithms):
+    """
+    Checks whether the algorithms can be sent to worker processes.
+    """
+    try:
+        pickle.dumps(algorithms)
+    except (pickle.PicklingError, AttributeError, TypeError):  # e.g. lambdas and local functions
+        return False
+    return True
+
+def _warm_up(algorithms, weights, profits, capacity):
+    """
+    Runs every algorithm once, unmeasured, so that imports and JIT compilation
+    are not counted in the measurements that follow.
+    """
+    for algo in algorithms.values():
+        algo(weights, profits, capacity)
+
+def measure_complexity(algorithms, weights, profits, capacity, runs=5, workers=None):
     """
     Measures the time and space complexity of given algorithms over multiple runs.
 
+    Every algorithm is first run once unmeasured. The timed runs are always serial, so
+    they do not compete for CPU or memory bandwidth. On large instances with more than
+    one worker available, the memory runs, whose tracemalloc peaks are unaffected by
+    contention, go to a process pool; on small ones process start-up would dominate, so
+    they are serial too. Algorithms that cannot be pickled are always measured serially.
+
     Parameters:
-    - algorithms: A dictionary of algorithm names and their corresponding functions.
+    - algorithms: A dictionary of algorithm names and their corresponding functions,
+      called as `algo(weights, profits, capacity)`. Functions that also accept a `scratch`
+      keyword argument get reusable buffers across their timed runs.
     - weights: List of item weights.
     - profits: Quadratic profit matrix.
     - capacity: Knapsack capacity.
     - runs: Number of runs to average the results.
+    - workers: Maximum number of worker processes for the memory runs (defaults to the
+      number of CPUs). Use 1 to always measure serially.
 
     Returns:
     - A dictionary containing average time and memory usage for each algorithm.
     """
     results = {}
+    times = {}
+    memories = {}
 
-    for name, algo in algorithms.items():
-        times = []
-        memories = []
-
-        for _ in range(runs):
-            # Start tracking memory
-            tracemalloc.start()
+    parallel = (
+        runs > 1
+        and (workers or os.cpu_count() or 1) > 1
+        and len(weights) * (capacity + 1) >= PARALLEL_MIN_CELLS
+        and _picklable(algorithms)
+    )
 
-            # Measure execution time
-            start_time = time.perf_counter()
-            algo(weights, profits, capacity)
-            end_time = time.perf_counter()
+    _warm_up(algorithms, weights, profits, capacity)
 
-            # Stop tracking memory
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
+    for name, algo in algorithms.items():
+        # Time the runs without tracemalloc, whose allocation hooks would slow them down.
+        # Buffers are allocated by the first run and reused by the following ones.
+        scratch = {} if _accepts_scratch(algo) else None
+        times[name] = [_time_run(algo, weights, profits, capacity, scratch) for _ in range(runs)]
 
-            # Record results for this run
-            times.append(end_time - start_time)
-            memories.append(peak / 10**6)  # Convert to MB
+    # Measure peak memory in a separate pass
+    if parallel:
+        init_args = (algorithms, weights, profits, capacity)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up, initargs=init_args) as pool:
+            memory_futures = {
+                name: [pool.submit(_memory_run, algo, weights, profits, capacity) for _ in range(runs)]
+                for name, algo in algorithms.items()
+            }
+            for name in algorithms:
+                memories[name] = [future.result() for future in memory_futures[name]]
+    else:
+        for name, algo in algorithms.items():
+            memories[name] = [_memory_run(algo, weights, profits, capacity) for _ in range(runs)]
 
+    for name in algorithms:
         # Average results across runs
-        avg_time = sum(times) / runs
-        avg_memory = sum(memories) / runs
+        avg_time = sum(times[name]) / runs
+        avg_memory = sum(memories[name]) / runs
 
         # Correctly populate the results dictionary
         results[name] = {